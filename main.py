@@ -8,9 +8,9 @@ import argparse
 from terminal_core import TerminalCore
 
 
-def run_cli():
+def run_cli(allow_external=False):
     """Run the CLI terminal interface"""
-    terminal = TerminalCore()
+    terminal = TerminalCore(allow_external=allow_external)
 
     print("Python Terminal Simulator")
     print("Type 'help' for available commands, 'exit' to quit.")
@@ -36,8 +36,12 @@ def run_cli():
                 print("Goodbye!")
                 break
 
-            # Display output
-            if result["output"]:
+            # Display output, writing streamed output chunk by chunk
+            if "output_iter" in result:
+                for chunk in result["output_iter"]:
+                    sys.stdout.write(chunk)
+                print()
+            elif result["output"]:
                 print(result["output"])
 
         except KeyboardInterrupt:
@@ -49,11 +53,46 @@ def run_cli():
             print(f"Error: {e}")
 
 
+def run_web(app, dev=False, workers=1, threads=8):
+    """Run the web interface"""
+    if dev:
+        # Werkzeug development server with debugger and reloader
+        app.run(debug=True, host='0.0.0.0', port=5000)
+        return
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # gunicorn is not available (e.g. on Windows), use a threaded Werkzeug server
+        app.run(host='0.0.0.0', port=5000, threaded=True)
+        return
+
+    class WebServer(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", "0.0.0.0:5000")
+            self.cfg.set("workers", workers)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", threads)
+
+        def load(self):
+            return app
+
+    WebServer().run()
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Python Terminal Simulator")
     parser.add_argument("--web", action="store_true",
                        help="Start web interface instead of CLI")
+    parser.add_argument("--dev", action="store_true",
+                       help="Use the Flask development server with debugging")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Web server worker processes (sessions are kept per process)")
+    parser.add_argument("--threads", type=int, default=8,
+                       help="Threads per web server worker")
+    parser.add_argument("--allow-external", action="store_true",
+                       help="Run unknown commands as programs found on PATH")
 
     args = parser.parse_args()
 
@@ -61,15 +100,17 @@ def main():
         # Import webapp here to avoid import errors if Flask is not installed
         try:
             from webapp import app
-            print("Starting web interface on http://localhost:5000")
-            print("Press Ctrl+C to stop the server")
-            app.run(debug=True, host='0.0.0.0', port=5000)
         except ImportError:
-            print("Error: Flask is required for web interface.")
-            print("Install it with: pip install Flask")
+            print("Error: Flask, cachetools and orjson are required for web interface.")
+            print("Install them with: pip install -r requirements.txt")
             sys.exit(1)
+        if args.allow_external:
+            app.config["ALLOW_EXTERNAL"] = True
+        print("Starting web interface on http://localhost:5000")
+        print("Press Ctrl+C to stop the server")
+        run_web(app, args.dev, args.workers, args.threads)
     else:
-        run_cli()
+        run_cli(args.allow_external)
 
 
 if __name__ == "__main__":
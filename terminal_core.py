@@ -3,94 +3,343 @@ Terminal Core Module
 Handles command parsing and execution for the Python terminal simulator.
 """
 import os
+import sys
+import platform
+import heapq
 import shutil
-import psutil
+import functools
+import itertools
+import re
+import shlex
+import time
+import threading
 import subprocess
+from collections import deque
+import psutil
 from datetime import datetime
-import json
+
+# Entries per page when "ls --page" is used without "-n"
+LS_PAGE_SIZE = 100
+
+# Maximum number of commands kept in a session's history
+HISTORY_MAXLEN = 1000
+
+# Longest command line stored per history entry
+HISTORY_ENTRY_MAXLEN = 10_000
+
+# Files larger than this in total are streamed by "cat" in CAT_CHUNK_SIZE pieces
+CAT_STREAM_THRESHOLD = 1024 * 1024
+CAT_CHUNK_SIZE = 64 * 1024
+
+# Flags used by "touch" to create missing files (O_CLOEXEC is POSIX-only)
+TOUCH_FLAGS = os.O_CREAT | os.O_WRONLY | getattr(os, "O_CLOEXEC", 0)
+
+# Seconds an external program may run before it is killed
+EXTERNAL_TIMEOUT = 30
+
+# Bytes of output an external program may produce before it is killed
+EXTERNAL_OUTPUT_LIMIT = 1024 * 1024
+
+# Shortest window, in seconds, a non-blocking CPU usage sample may cover
+CPU_MIN_SAMPLE = 0.1
+
+# Number of processes listed by "ps"
+PS_LIMIT = 20
+
+# /proc/<pid>/stat state codes, named the way psutil reports them
+PROC_STATES = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "Z": "zombie",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "X": "dead",
+    "x": "dead",
+    "K": "wake-kill",
+    "W": "waking",
+    "P": "parked",
+    "I": "idle",
+}
+
+HELP_TEXT = """
+Available Commands:
+  ls [path]        - List directory contents
+    -n <limit>     - Show at most <limit> entries
+    --page <n>     - Show page <n> of the listing
+  cd [path]        - Change directory
+  pwd              - Print working directory
+  mkdir <dir>      - Create directory
+  rmdir <dir>      - Remove empty directory
+  rm <file/dir>    - Remove file or directory
+  touch <file>     - Create empty file or update timestamp
+  cat <file>       - Display file contents
+  echo <text>      - Display text
+  mv <src> <dst>   - Move/rename file
+  cp <src> <dst>   - Copy file
+  ps               - List processes
+  cpu              - Show CPU information
+  mem              - Show memory information
+  sysinfo          - Show system information
+  history          - Show command history
+  help             - Show this help
+  clear            - Clear screen
+  exit             - Exit terminal
+"""
+
+
+def _truncate(text, limit):
+    """Cut text to limit characters, adding an ellipsis when cut"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _err(message):
+    """Build a failed command result"""
+    return {"success": False, "output": message}
+
+
+# Fixed results shared by every call; callers must not mutate them
+_HELP_RESULT = {"success": True, "output": HELP_TEXT.strip()}
+_CLEAR_RESULT = {"success": True, "output": "\033[2J\033[H"}  # ANSI clear screen
+_EMPTY_RESULT = {"success": True, "output": ""}
+_NO_HISTORY_RESULT = {"success": True, "output": "No commands in history"}
+_EXIT_RESULT = {"success": True, "output": "exit", "exit": True}
+_MISSING_OPERAND = {command: _err(f"{command}: missing operand")
+                    for command in ("mkdir", "rmdir", "rm", "touch", "cat", "mv", "cp")}
+_ERR_PERMISSION_DENIED = _err("Permission denied")
+_ERR_LS_MISSING_ARGUMENT = _err("ls: option requires an argument")
+_ERR_LS_INVALID_NUMBER = _err("ls: invalid number")
+_ERR_LS_NOT_POSITIVE = _err("ls: limit and page must be positive")
+
+
+_WORD = re.compile(r'\S+')
+
+# Quote characters that need shlex to split a command line
+_QUOTES = frozenset('"\'')
+
+
+def format_timestamp(ns):
+    """Format a history timestamp in nanoseconds since the epoch"""
+    return datetime.fromtimestamp(ns / 1_000_000_000).isoformat(timespec='seconds')
+
+
+def _split(cmd):
+    """Split a command line on whitespace and quotes"""
+    if _QUOTES.isdisjoint(cmd):
+        # Plain whitespace-separated words, split in C by the regex engine
+        return tuple(_WORD.findall(cmd))
+    lexer = shlex.shlex(cmd, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    lexer.escape = ""  # Keep backslashes literal, e.g. in Windows paths
+    try:
+        return tuple(lexer)
+    except ValueError:
+        # Unbalanced quote, e.g. an apostrophe in plain text like "it's"
+        return tuple(_WORD.findall(cmd))
+
+
+# Repeated command lines skip the lexer; only short lines are cached so the
+# cache cannot pin pasted blobs in memory
+_split_cached = functools.lru_cache(maxsize=256)(_split)
+
+
+def _tokenize(cmd):
+    """Split a command line, caching it if it is short"""
+    if len(cmd) <= HISTORY_ENTRY_MAXLEN:
+        return _split_cached(cmd)
+    return _split(cmd)
+
+
+@functools.lru_cache(maxsize=None)
+def _cpu_count():
+    """Number of CPU cores, read once per process"""
+    return psutil.cpu_count()
+
+
+@functools.lru_cache(maxsize=None)
+def _sysinfo_header():
+    """Static part of the sysinfo output, built once per process on first use"""
+    return (
+        "=== System Information ===\n"
+        f"Platform: {platform.platform()}\n"
+        f"Processor: {platform.processor()}\n"
+        f"Python Version: {sys.version}\n"
+    )
+
+
+# psutil keeps the last CPU times process-wide (older versions) or per thread
+# (newer ones), so track both to know whether a non-blocking sample is valid
+_cpu_lock = threading.Lock()
+_cpu_thread = threading.local()
+_cpu_last_sample = None
+
+
+def _cpu_percent():
+    """Sample CPU usage, blocking briefly if the previous sample is too recent"""
+    global _cpu_last_sample
+    with _cpu_lock:
+        now = time.monotonic()
+        if (getattr(_cpu_thread, "last_sample", None) is None
+                or now - _cpu_last_sample < CPU_MIN_SAMPLE):
+            percent = psutil.cpu_percent(interval=CPU_MIN_SAMPLE)
+        else:
+            percent = psutil.cpu_percent(interval=None)
+        _cpu_last_sample = _cpu_thread.last_sample = time.monotonic()
+        return percent
+
+
+# Prime the CPU usage counter once so "cpu" can usually sample without blocking
+psutil.cpu_percent(interval=None)
+_cpu_last_sample = _cpu_thread.last_sample = time.monotonic()
+
+
+def _iter_files(files):
+    """Yield the contents of open text files in chunks, closing them when done"""
+    try:
+        for i, f in enumerate(files):
+            if i:
+                yield "\n"
+            yield from iter(functools.partial(f.read, CAT_CHUNK_SIZE), "")
+    finally:
+        for f in files:
+            f.close()
 
 
 class TerminalCore:
-    def __init__(self):
-        self.history = []
+    def __init__(self, allow_external=False):
+        self.history = deque(maxlen=HISTORY_MAXLEN)
+        # Run unknown commands as programs found on PATH (off by default)
+        self.allow_external = allow_external
         self.current_dir = os.getcwd()
 
     def parse_command(self, cmd):
         """Parse command and arguments"""
-        parts = cmd.strip().split()
+        parts = _tokenize(cmd.strip())
         if not parts:
-            return {"success": True, "output": ""}
+            return _EMPTY_RESULT
 
-        command = parts[0].lower()
-        args = parts[1:]
+        command = parts[0]
+        args = list(parts[1:])
         return self.execute_command(command, args)
 
     def execute_command(self, command, args):
         """Execute the parsed command"""
         try:
-            # Store command in history
+            # Store command in history, truncating oversized command lines
+            args_text = " ".join(args)
+            history_command, history_args = command, args
+            if len(command) + 1 + len(args_text) > HISTORY_ENTRY_MAXLEN:
+                history_command = _truncate(command, HISTORY_ENTRY_MAXLEN)
+                args_text = _truncate(args_text, max(0, HISTORY_ENTRY_MAXLEN - len(command) - 1))
+                history_args = [args_text] if args_text else []
             self.history.append({
-                "command": command,
-                "args": args,
-                "timestamp": datetime.now().isoformat(),
+                "command": history_command,
+                "args": history_args,
+                "display": f"{history_command} {args_text}",
+                "timestamp": time.time_ns(),
                 "cwd": self.current_dir
             })
 
-            # Execute command based on type
-            if command == "ls":
-                return self._cmd_ls(args)
-            elif command == "cd":
-                return self._cmd_cd(args)
-            elif command == "pwd":
-                return self._cmd_pwd(args)
-            elif command == "mkdir":
-                return self._cmd_mkdir(args)
-            elif command == "rmdir":
-                return self._cmd_rmdir(args)
-            elif command == "rm":
-                return self._cmd_rm(args)
-            elif command == "touch":
-                return self._cmd_touch(args)
-            elif command == "cat":
-                return self._cmd_cat(args)
-            elif command == "echo":
-                return self._cmd_echo(args)
-            elif command == "mv":
-                return self._cmd_mv(args)
-            elif command == "cp":
-                return self._cmd_cp(args)
-            elif command == "ps":
-                return self._cmd_ps(args)
-            elif command == "cpu":
-                return self._cmd_cpu(args)
-            elif command == "mem":
-                return self._cmd_mem(args)
-            elif command == "sysinfo":
-                return self._cmd_sysinfo(args)
-            elif command == "history":
-                return self._cmd_history(args)
-            elif command == "help":
-                return self._cmd_help(args)
-            elif command == "clear":
-                return self._cmd_clear(args)
-            elif command == "exit":
-                return self._cmd_exit(args)
-            else:
-                return {"success": False, "output": f"Unknown command: {command}"}
+            # Built-in commands are case-insensitive, external programs are not
+            handler = self._DISPATCH.get(command.lower())
+            if handler is None:
+                if self.allow_external and shutil.which(command):
+                    return self._run_external(command, args)
+                return _err(f"Unknown command: {command}")
+            return handler(self, args)
 
         except Exception as e:
-            return {"success": False, "output": f"Error: {str(e)}"}
+            return _err(f"Error: {str(e)}")
+
+    def _run_external(self, command, args):
+        """Run a program directly (without a shell) and capture its output"""
+        proc = subprocess.Popen(
+            [command, *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=self.current_dir,
+        )
+        timed_out = threading.Event()
+
+        def expire():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(EXTERNAL_TIMEOUT, expire)
+        timer.start()
+        chunks = []
+        size = 0
+        truncated = False
+        try:
+            # Read in chunks so a chatty program cannot fill memory before the timeout
+            for chunk in iter(functools.partial(proc.stdout.read1, CAT_CHUNK_SIZE), b""):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > EXTERNAL_OUTPUT_LIMIT:
+                    truncated = True
+                    proc.kill()
+                    break
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            proc.wait()
+
+        if timed_out.is_set():
+            return _err(f"{command}: timed out after {EXTERNAL_TIMEOUT}s")
+        output = b"".join(chunks)[:EXTERNAL_OUTPUT_LIMIT].decode(errors="replace").rstrip("\n")
+        if truncated:
+            return _err(f"{output}\n{command}: output exceeded {EXTERNAL_OUTPUT_LIMIT} bytes, killed")
+        return {"success": proc.returncode == 0, "output": output}
+
+    def recent_history(self, count):
+        """Return the last count history entries as a list"""
+        start = max(0, len(self.history) - count)
+        return list(itertools.islice(self.history, start, None))
 
     def _cmd_ls(self, args):
         """List directory contents"""
-        path = args[0] if args else "."
+        path = None
+        limit = None
+        page = 1
+        options = iter(args)
+        try:
+            for arg in options:
+                if arg == "-n":
+                    limit = int(next(options))
+                elif arg == "--page":
+                    page = int(next(options))
+                elif arg.startswith("-") and arg != "-":
+                    return _err(f"ls: unknown option: {arg}")
+                elif path is None:
+                    # Like before, only the first path is listed
+                    path = arg
+        except StopIteration:
+            return _ERR_LS_MISSING_ARGUMENT
+        except ValueError:
+            return _ERR_LS_INVALID_NUMBER
+
+        if path is None:
+            path = "."
+        if limit is None and page > 1:
+            limit = LS_PAGE_SIZE
+        if (limit is not None and limit < 1) or page < 1:
+            return _ERR_LS_NOT_POSITIVE
+
         try:
-            items = os.listdir(path)
-            return {"success": True, "output": "\n".join(sorted(items))}
+            with os.scandir(path) as entries:
+                names = (entry.name for entry in entries)
+                if limit is None:
+                    items = sorted(names)
+                else:
+                    # Only keep the entries up to the requested page in memory
+                    items = heapq.nsmallest(limit * page, names)[limit * (page - 1):]
+            return {"success": True, "output": "\n".join(items)}
         except FileNotFoundError:
-            return {"success": False, "output": f"Directory not found: {path}"}
+            return _err(f"Directory not found: {path}")
         except PermissionError:
-            return {"success": False, "output": f"Permission denied: {path}"}
+            return _err(f"Permission denied: {path}")
 
     def _cmd_cd(self, args):
         """Change directory"""
@@ -98,11 +347,11 @@ class TerminalCore:
         try:
             os.chdir(path)
             self.current_dir = os.getcwd()
-            return {"success": True, "output": ""}
+            return _EMPTY_RESULT
         except FileNotFoundError:
-            return {"success": False, "output": f"Directory not found: {path}"}
+            return _err(f"Directory not found: {path}")
         except PermissionError:
-            return {"success": False, "output": f"Permission denied: {path}"}
+            return _err(f"Permission denied: {path}")
 
     def _cmd_pwd(self, args):
         """Print working directory"""
@@ -111,33 +360,33 @@ class TerminalCore:
     def _cmd_mkdir(self, args):
         """Create directory"""
         if not args:
-            return {"success": False, "output": "mkdir: missing operand"}
+            return _MISSING_OPERAND["mkdir"]
 
         for path in args:
             try:
                 os.makedirs(path, exist_ok=True)
             except PermissionError:
-                return {"success": False, "output": f"Permission denied: {path}"}
-        return {"success": True, "output": ""}
+                return _err(f"Permission denied: {path}")
+        return _EMPTY_RESULT
 
     def _cmd_rmdir(self, args):
         """Remove directory"""
         if not args:
-            return {"success": False, "output": "rmdir: missing operand"}
+            return _MISSING_OPERAND["rmdir"]
 
         for path in args:
             try:
                 os.rmdir(path)
             except FileNotFoundError:
-                return {"success": False, "output": f"Directory not found: {path}"}
+                return _err(f"Directory not found: {path}")
             except OSError as e:
-                return {"success": False, "output": f"Cannot remove directory: {e}"}
-        return {"success": True, "output": ""}
+                return _err(f"Cannot remove directory: {e}")
+        return _EMPTY_RESULT
 
     def _cmd_rm(self, args):
         """Remove file"""
         if not args:
-            return {"success": False, "output": "rm: missing operand"}
+            return _MISSING_OPERAND["rm"]
 
         for path in args:
             try:
@@ -146,39 +395,53 @@ class TerminalCore:
                 else:
                     os.remove(path)
             except FileNotFoundError:
-                return {"success": False, "output": f"File not found: {path}"}
+                return _err(f"File not found: {path}")
             except PermissionError:
-                return {"success": False, "output": f"Permission denied: {path}"}
-        return {"success": True, "output": ""}
+                return _err(f"Permission denied: {path}")
+        return _EMPTY_RESULT
 
     def _cmd_touch(self, args):
         """Create empty file or update timestamp"""
         if not args:
-            return {"success": False, "output": "touch: missing operand"}
+            return _MISSING_OPERAND["touch"]
 
         for path in args:
             try:
-                with open(path, 'a'):
+                try:
                     os.utime(path, None)
+                except FileNotFoundError:
+                    fd = os.open(path, TOUCH_FLAGS, 0o666)
+                    os.close(fd)
             except PermissionError:
-                return {"success": False, "output": f"Permission denied: {path}"}
-        return {"success": True, "output": ""}
+                return _err(f"Permission denied: {path}")
+        return _EMPTY_RESULT
 
     def _cmd_cat(self, args):
         """Display file contents"""
         if not args:
-            return {"success": False, "output": "cat: missing operand"}
+            return _MISSING_OPERAND["cat"]
 
-        output = []
-        for path in args:
-            try:
-                with open(path, 'r') as f:
-                    output.append(f.read())
-            except FileNotFoundError:
-                return {"success": False, "output": f"File not found: {path}"}
-            except PermissionError:
-                return {"success": False, "output": f"Permission denied: {path}"}
-        return {"success": True, "output": "\n".join(output)}
+        files = []
+        try:
+            for path in args:
+                try:
+                    files.append(open(path, 'r'))
+                except FileNotFoundError:
+                    return _err(f"File not found: {path}")
+                except PermissionError:
+                    return _err(f"Permission denied: {path}")
+
+            if sum(os.fstat(f.fileno()).st_size for f in files) > CAT_STREAM_THRESHOLD:
+                # Hand the open files to a generator so only one chunk is in memory;
+                # undecodable bytes are replaced since errors cannot be reported mid-stream
+                for f in files:
+                    f.reconfigure(errors='replace')
+                stream, files = _iter_files(files), []
+                return {"success": True, "output": "", "output_iter": stream}
+            return {"success": True, "output": "\n".join(f.read() for f in files)}
+        finally:
+            for f in files:
+                f.close()
 
     def _cmd_echo(self, args):
         """Display text"""
@@ -187,21 +450,21 @@ class TerminalCore:
     def _cmd_mv(self, args):
         """Move/rename file"""
         if len(args) < 2:
-            return {"success": False, "output": "mv: missing operand"}
+            return _MISSING_OPERAND["mv"]
 
         src, dst = args[0], args[1]
         try:
             shutil.move(src, dst)
-            return {"success": True, "output": ""}
+            return _EMPTY_RESULT
         except FileNotFoundError:
-            return {"success": False, "output": f"File not found: {src}"}
+            return _err(f"File not found: {src}")
         except PermissionError:
-            return {"success": False, "output": "Permission denied"}
+            return _ERR_PERMISSION_DENIED
 
     def _cmd_cp(self, args):
         """Copy file"""
         if len(args) < 2:
-            return {"success": False, "output": "cp: missing operand"}
+            return _MISSING_OPERAND["cp"]
 
         src, dst = args[0], args[1]
         try:
@@ -209,35 +472,57 @@ class TerminalCore:
                 shutil.copytree(src, dst)
             else:
                 shutil.copy2(src, dst)
-            return {"success": True, "output": ""}
+            return _EMPTY_RESULT
         except FileNotFoundError:
-            return {"success": False, "output": f"File not found: {src}"}
+            return _err(f"File not found: {src}")
         except PermissionError:
-            return {"success": False, "output": "Permission denied"}
+            return _ERR_PERMISSION_DENIED
 
     def _cmd_ps(self, args):
         """List processes"""
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'status']):
-                processes.append(f"{proc.info['pid']:6} {proc.info['name']:20} {proc.info['status']}")
-            return {"success": True, "output": "\n".join(processes[:20])}  # Limit output
+            if sys.platform.startswith("linux"):
+                processes = self._proc_processes()
+            else:
+                processes = []
+                for proc in psutil.process_iter(['pid', 'name', 'status']):
+                    processes.append(f"{proc.info['pid']:6} {proc.info['name']:20} {proc.info['status']}")
+                    if len(processes) == PS_LIMIT:  # Limit output
+                        break
+            return {"success": True, "output": "\n".join(processes)}
         except Exception as e:
-            return {"success": False, "output": f"Error getting processes: {e}"}
+            return _err(f"Error getting processes: {e}")
+
+    def _proc_processes(self):
+        """Read the lowest PS_LIMIT pids straight from /proc"""
+        with os.scandir("/proc") as entries:
+            pids = heapq.nsmallest(PS_LIMIT, (int(entry.name) for entry in entries
+                                              if entry.name.isdigit()))
+        processes = []
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/stat", "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue  # Process exited after the scan
+            # Format is "pid (comm) state ..." and comm may contain spaces or ")"
+            name, _, rest = data[data.index(b"(") + 1:].rpartition(b")")
+            state = rest.split(None, 1)[0].decode()
+            processes.append(f"{pid:6} {name.decode(errors='replace'):20} {PROC_STATES.get(state, state)}")
+        return processes
 
     def _cmd_cpu(self, args):
         """Show CPU information"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
+            cpu_percent = _cpu_percent()
             cpu_freq = psutil.cpu_freq()
             output = f"CPU Usage: {cpu_percent}%\n"
-            output += f"CPU Cores: {cpu_count}\n"
+            output += f"CPU Cores: {_cpu_count()}\n"
             if cpu_freq:
                 output += f"CPU Frequency: {cpu_freq.current:.2f} MHz"
             return {"success": True, "output": output}
         except Exception as e:
-            return {"success": False, "output": f"Error getting CPU info: {e}"}
+            return _err(f"Error getting CPU info: {e}")
 
     def _cmd_mem(self, args):
         """Show memory information"""
@@ -249,60 +534,57 @@ class TerminalCore:
             output += f"Memory Usage: {mem.percent}%"
             return {"success": True, "output": output}
         except Exception as e:
-            return {"success": False, "output": f"Error getting memory info: {e}"}
+            return _err(f"Error getting memory info: {e}")
 
     def _cmd_sysinfo(self, args):
         """Show system information"""
         try:
-            output = "=== System Information ===\n"
-            output += f"Platform: {psutil.platform.platform()}\n"
-            output += f"Processor: {psutil.platform.processor()}\n"
-            output += f"Python Version: {psutil.sys.version}\n"
+            output = _sysinfo_header()
             output += f"Current Directory: {self.current_dir}"
             return {"success": True, "output": output}
         except Exception as e:
-            return {"success": False, "output": f"Error getting system info: {e}"}
+            return _err(f"Error getting system info: {e}")
 
     def _cmd_history(self, args):
         """Show command history"""
         if not self.history:
-            return {"success": True, "output": "No commands in history"}
+            return _NO_HISTORY_RESULT
 
-        output = []
-        for i, cmd in enumerate(self.history[-20:], 1):  # Last 20 commands
-            output.append(f"{i:3} {cmd['timestamp']} {cmd['command']} {' '.join(cmd['args'])}")
-        return {"success": True, "output": "\n".join(output)}
+        output = "\n".join(f"{i:3} {format_timestamp(cmd['timestamp'])} {cmd['display']}"
+                           for i, cmd in enumerate(self.recent_history(20), 1))  # Last 20 commands
+        return {"success": True, "output": output}
 
     def _cmd_help(self, args):
         """Show help information"""
-        help_text = """
-Available Commands:
-  ls [path]        - List directory contents
-  cd [path]        - Change directory
-  pwd              - Print working directory
-  mkdir <dir>      - Create directory
-  rmdir <dir>      - Remove empty directory
-  rm <file/dir>    - Remove file or directory
-  touch <file>     - Create empty file or update timestamp
-  cat <file>       - Display file contents
-  echo <text>      - Display text
-  mv <src> <dst>   - Move/rename file
-  cp <src> <dst>   - Copy file
-  ps               - List processes
-  cpu              - Show CPU information
-  mem              - Show memory information
-  sysinfo          - Show system information
-  history          - Show command history
-  help             - Show this help
-  clear            - Clear screen
-  exit             - Exit terminal
-"""
-        return {"success": True, "output": help_text.strip()}
+        return _HELP_RESULT
 
     def _cmd_clear(self, args):
         """Clear screen"""
-        return {"success": True, "output": "\033[2J\033[H"}  # ANSI clear screen
+        return _CLEAR_RESULT
 
     def _cmd_exit(self, args):
         """Exit terminal"""
-        return {"success": True, "output": "exit", "exit": True}
+        return _EXIT_RESULT
+
+    # Command name -> handler, shared by all instances
+    _DISPATCH = {
+        "ls": _cmd_ls,
+        "cd": _cmd_cd,
+        "pwd": _cmd_pwd,
+        "mkdir": _cmd_mkdir,
+        "rmdir": _cmd_rmdir,
+        "rm": _cmd_rm,
+        "touch": _cmd_touch,
+        "cat": _cmd_cat,
+        "echo": _cmd_echo,
+        "mv": _cmd_mv,
+        "cp": _cmd_cp,
+        "ps": _cmd_ps,
+        "cpu": _cmd_cpu,
+        "mem": _cmd_mem,
+        "sysinfo": _cmd_sysinfo,
+        "history": _cmd_history,
+        "help": _cmd_help,
+        "clear": _cmd_clear,
+        "exit": _cmd_exit,
+    }
@@ -2,25 +2,76 @@
 Flask Web Interface for Python Terminal Simulator
 Provides a web-based terminal interface.
 """
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import (Flask, Response, request, render_template,
+                   send_from_directory, stream_with_context)
 import os
-from terminal_core import TerminalCore
+import json
+import threading
+import orjson
+from cachetools import TTLCache
+from terminal_core import TerminalCore, format_timestamp
+
+# Size of the output slices sent per chunk by /api/exec
+STREAM_CHUNK_SIZE = 64 * 1024
 
 # Create Flask app
 app = Flask(__name__)
+# Running external programs is opt-in, also when served directly by gunicorn
+app.config["ALLOW_EXTERNAL"] = os.environ.get("TERMINAL_ALLOW_EXTERNAL") == "1"
 
 # Initialize terminal core
 terminal = TerminalCore()
 
-# Store terminal instances per session (simplified - in production use proper session management)
-terminals = {}
+# Store terminal instances per session (simplified - in production use proper session management).
+# Sessions idle for an hour are dropped, and at most 1024 are kept at once.
+terminals = TTLCache(maxsize=1024, ttl=3600)
+terminals_lock = threading.Lock()
 
 
 def get_terminal(session_id='default'):
     """Get or create terminal instance for session"""
-    if session_id not in terminals:
-        terminals[session_id] = TerminalCore()
-    return terminals[session_id]
+    with terminals_lock:
+        terminal = terminals.get(session_id)
+        if terminal is None:
+            terminal = TerminalCore(allow_external=app.config["ALLOW_EXTERNAL"])
+        # Re-inserting restarts the session's idle timer
+        terminals[session_id] = terminal
+        return terminal
+
+
+def dumps(obj):
+    """Encode obj as JSON bytes"""
+    try:
+        return orjson.dumps(obj)
+    except orjson.JSONEncodeError:
+        # orjson rejects lone surrogates, e.g. from undecodable file names
+        return json.dumps(obj).encode()
+
+
+def json_response(data, status=200):
+    """Build a JSON response"""
+    return app.response_class(dumps(data), status=status, mimetype='application/json')
+
+
+def stream_result(result):
+    """Yield a command result as JSON, sending its output in chunks"""
+    chunks = result.get("output_iter")
+    if chunks is None:
+        output = result.get("output", "")
+        chunks = (output[start:start + STREAM_CHUNK_SIZE]
+                  for start in range(0, len(output), STREAM_CHUNK_SIZE))
+    fields = {key: value for key, value in result.items()
+              if key not in ("output", "output_iter")}
+    yield dumps(fields)[:-1] + (b", " if fields else b"") + b'"output": "'
+    try:
+        for chunk in chunks:
+            # Encode each chunk as a JSON string and drop its surrounding quotes
+            yield dumps(chunk)[1:-1]
+    except Exception as e:
+        # Part of the body is already sent, so report the failure at the end
+        # of the output and still finish a valid JSON object
+        yield dumps(f"\nError: {e}")[1:-1]
+    yield b'"}'
 
 
 @app.route('/')
@@ -33,13 +84,13 @@ def index():
 def execute_command():
     """Execute a command via API"""
     try:
-        data = request.get_json()
-        if not data or 'cmd' not in data:
-            return jsonify({"success": False, "output": "Missing 'cmd' parameter"})
+        data = orjson.loads(request.get_data())
+        if not isinstance(data, dict) or 'cmd' not in data:
+            return json_response({"success": False, "output": "Missing 'cmd' parameter"})
 
         command = data['cmd'].strip()
         if not command:
-            return jsonify({"success": True, "output": ""})
+            return json_response({"success": True, "output": ""})
 
         # Get terminal instance
         session_id = request.headers.get('X-Session-ID', 'default')
@@ -48,10 +99,11 @@ def execute_command():
         # Execute command
         result = terminal.parse_command(command)
 
-        return jsonify(result)
+        return Response(stream_with_context(stream_result(result)),
+                        mimetype='application/json')
 
     except Exception as e:
-        return jsonify({"success": False, "output": f"Server error: {str(e)}"})
+        return json_response({"success": False, "output": f"Server error: {str(e)}"})
 
 
 @app.route('/api/history', methods=['GET'])
@@ -61,16 +113,20 @@ def get_history():
         session_id = request.headers.get('X-Session-ID', 'default')
         terminal = get_terminal(session_id)
 
-        # Get last 10 commands from history
-        history = terminal.history[-10:] if terminal.history else []
+        # Get last 10 commands from history, with readable timestamps. The
+        # display line only repeats command and args, so it is not sent.
+        history = [{key: value for key, value in entry.items() if key != "display"}
+                   for entry in terminal.recent_history(10)]
+        for entry in history:
+            entry["timestamp"] = format_timestamp(entry["timestamp"])
 
-        return jsonify({
+        return json_response({
             "success": True,
             "history": history
         })
 
     except Exception as e:
-        return jsonify({"success": False, "output": f"Error getting history: {str(e)}"})
+        return json_response({"success": False, "output": f"Error getting history: {str(e)}"})
 
 
 @app.route('/api/clear', methods=['POST'])
@@ -82,10 +138,10 @@ def clear_history():
 
         terminal.history.clear()
 
-        return jsonify({"success": True, "output": "History cleared"})
+        return json_response({"success": True, "output": "History cleared"})
 
     except Exception as e:
-        return jsonify({"success": False, "output": f"Error clearing history: {str(e)}"})
+        return json_response({"success": False, "output": f"Error clearing history: {str(e)}"})
 
 
 @app.route('/static/<path:filename>')
@@ -97,13 +153,15 @@ def serve_static(filename):
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({"success": False, "output": "Endpoint not found"}), 404
+    return json_response({"success": False, "output": "Endpoint not found"}, 404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({"success": False, "output": "Internal server error"}), 500
+    return json_response({"success": False, "output": "Internal server error"}, 500)
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Same server setup as "main.py --web" (gunicorn, no debugger)
+    from main import run_web
+    run_web(app)